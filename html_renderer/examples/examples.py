@@ -1,6 +1,11 @@
+import numpy as np
+
 from html_renderer.renderer import HTMLRenderer
 from html_renderer.plotly_helper import PlotlyHelper
 
+# Test scores for the statistics example, generated once (mean=78, std=12)
+_SCORES = np.random.default_rng(42).normal(78, 12, 100)
+
 # Example usage functions
 def create_math_question_example():
     """Example of a math question with LaTeX and a plot."""
@@ -12,13 +17,12 @@ def create_math_question_example():
     """
     
     # Create a plot of the quadratic function
-    import numpy as np
     x = np.linspace(-1, 5, 100)
-    y = x**2 - 4*x + 3
+    y = (x - 4) * x + 3  # x² - 4x + 3 in Horner form
     
     fig = PlotlyHelper.create_line_chart(
-        x_data=x.tolist(),
-        y_data=y.tolist(),
+        x_data=x,
+        y_data=y,
         title="f(x) = x² - 4x + 3",
         x_label="x",
         y_label="f(x)",
@@ -42,8 +46,7 @@ def create_math_question_example():
         r"$x = -1$ and $x = 5$"
     ]
 
-    for option in options:
-        renderer.add_content(option, content_type="option")
+    renderer.add_options(options)
     
     return renderer.render()
 
@@ -59,7 +62,7 @@ def create_data_analysis_example():
     months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun']
     sales = [12000, 15000, 14000, 18000, 22000, 25000]
     
-    fig = PlotlyHelper.create_bar_chart(
+    fig_json = PlotlyHelper.create_bar_chart_fast(
         x_data=months,
         y_data=sales,
         title="Monthly Sales Data",
@@ -70,13 +73,16 @@ def create_data_analysis_example():
     
     renderer = HTMLRenderer(title="Data Analysis Question")
     renderer.add_content(question_content, content_type="question") \
-            .add_plotly_figure(fig)
+            .add_plotly_figure_json(fig_json)
     
-    # Options with individual charts showing percentage changes
-    option_texts = ["February (+25%)", "March (-6.7%)", "April (+28.6%)", "May (+22.2%)"]
+    # Options showing the month-over-month percentage changes
+    sales_array = np.asarray(sales, dtype=np.float64)
+    pct_change = np.diff(sales_array) / sales_array[:-1] * 100.0
+    changes = list(zip(months[1:], pct_change))
+    # The first four changes are offered as options; June's is left out on purpose
+    option_texts = [f"{month} ({pct:+.1f}%)" for month, pct in changes[:4]]
     
-    for text in option_texts:
-        renderer.add_content(f"<p><strong>{text}</strong></p>", content_type="option")
+    renderer.add_options([f"<p><strong>{text}</strong></p>" for text in option_texts])
     
     return renderer.render()
 
@@ -89,12 +95,8 @@ def create_statistics_example():
     """
     
     # Create histogram of test scores
-    import numpy as np
-    np.random.seed(42)
-    scores = np.random.normal(78, 12, 100)  # Mean=78, std=12
-    
-    fig = PlotlyHelper.create_histogram(
-        data=scores.tolist(),
+    fig_json = PlotlyHelper.create_histogram_fast(
+        data=_SCORES,
         title="Test Score Distribution",
         x_label="Score",
         bins=15
@@ -102,7 +104,7 @@ def create_statistics_example():
     
     renderer = HTMLRenderer(title="Statistics Question")
     renderer.add_content(question_content, content_type="question") \
-            .add_plotly_figure(fig)
+            .add_plotly_figure_json(fig_json)
     
     options = [
         "Approximately 65",
@@ -111,8 +113,7 @@ def create_statistics_example():
         "Approximately 92"
     ]
 
-    for option in options:
-        renderer.add_content(option, content_type="option")
+    renderer.add_options(options)
     
     return renderer.render()
 
@@ -144,8 +145,7 @@ def create_pie_chart_example():
         "Brand D"
     ]
 
-    for option in options:
-        renderer.add_content(option, content_type="option")
+    renderer.add_options(options)
 
     return renderer.render()
 
@@ -168,12 +168,12 @@ def create_combined_example():
     renderer = HTMLRenderer(title="Combined Report")
     renderer.add_content("<h2>Combined Report</h2>") \
             .add_content("<p>This report contains a bar chart, a pie chart, and a data table.</p>") \
-            .add_plotly_figure(PlotlyHelper.create_bar_chart(
+            .add_plotly_figure_json(PlotlyHelper.create_bar_chart_json(
                 x_data=["A", "B", "C","D","E","F"],
                 y_data=[10, 12, 15,25,20,22],
                 title="Bar Chart"
             )) \
-            .add_plotly_figure(PlotlyHelper.create_pie_chart(
+            .add_plotly_figure_json(PlotlyHelper.create_pie_chart_json(
                 labels=["X", "Y", "Z"],
                 values=[40, 30, 30],
                 title="Pie Chart"
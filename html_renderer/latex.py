@@ -0,0 +1,118 @@
+import html
+import json
+import os
+import re
+import subprocess
+import threading
+from typing import List, Optional, Tuple
+
+# Math segments, in the order KaTeX auto-render tries its delimiters
+_MATH_RE = re.compile(r'\$\$(.+?)\$\$|\\\[(.+?)\\\]|\\\((.+?)\\\)|\$(.+?)\$', re.S)
+
+# Worker loop: one JSON batch of [tex, displayMode] pairs per line in,
+# one JSON array of rendered HTML strings (null on failure) per line out.
+_WORKER_JS = r'''
+const katex = require("katex");
+const readline = require("readline");
+readline.createInterface({input: process.stdin}).on("line", function(line) {
+    const out = JSON.parse(line).map(function(item) {
+        try {
+            return katex.renderToString(item[0], {displayMode: item[1], throwOnError: false});
+        } catch (e) {
+            return null;
+        }
+    });
+    process.stdout.write(JSON.stringify(out) + "\n");
+});
+'''
+
+
+class KatexPrerenderer:
+    """
+    Pre-renders LaTeX to HTML on the server with KaTeX running in a long-lived Node.js process.
+    The rendered markup only needs the KaTeX stylesheet, so pages no longer have to load
+    and run KaTeX in the browser. Requires ``node`` and the ``katex`` npm package.
+    """
+
+    def __init__(self, node: str = "node", node_path: Optional[str] = None):
+        """
+        Initialize the pre-renderer. The Node.js worker is started on first use.
+
+        Args:
+            node: Path to the Node.js executable
+            node_path: Directory containing the ``katex`` package (added to NODE_PATH)
+        """
+        self.node = node
+        self.node_path = node_path
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> subprocess.Popen:
+        """Start the Node.js worker if it is not already running."""
+        if self._process is None or self._process.poll() is not None:
+            env = dict(os.environ)
+            if self.node_path:
+                env["NODE_PATH"] = os.pathsep.join(filter(None, [self.node_path, env.get("NODE_PATH")]))
+            self._process = subprocess.Popen(
+                [self.node, "-e", _WORKER_JS],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                env=env,
+                text=True,
+                encoding="utf-8",
+            )
+        return self._process
+
+    def render_batch(self, items: List[Tuple[str, bool]]) -> List[Optional[str]]:
+        """
+        Render LaTeX expressions in a single round-trip to the worker.
+
+        Args:
+            items: (tex, display_mode) pairs
+
+        Returns:
+            Rendered HTML for each item, or None where KaTeX failed
+        """
+        if not items:
+            return []
+        with self._lock:
+            process = self._ensure_started()
+            try:
+                process.stdin.write(json.dumps(items) + "\n")
+                process.stdin.flush()
+                line = process.stdout.readline()
+            except (BrokenPipeError, ValueError) as e:
+                raise RuntimeError(f"KaTeX worker is not available: {e}") from e
+        if not line:
+            raise RuntimeError("KaTeX worker exited; is the katex npm package installed?")
+        return json.loads(line)
+
+    def prerender(self, contents: List[str]) -> List[str]:
+        """
+        Replace the LaTeX in each content string with KaTeX HTML.
+        All expressions across all contents are rendered in one batch.
+        Expressions KaTeX cannot render are left untouched.
+        """
+        items = []
+        for content in contents:
+            for match in _MATH_RE.finditer(content):
+                # Content is HTML, so "$a &lt; b$" means the TeX "a < b"
+                tex = html.unescape(next(group for group in match.groups() if group is not None))
+                display = match.group(1) is not None or match.group(2) is not None
+                items.append((tex, display))
+        rendered = iter(self.render_batch(items))
+
+        def substitute(match: re.Match) -> str:
+            result = next(rendered)
+            return result if result is not None else match.group(0)
+
+        return [_MATH_RE.sub(substitute, content) for content in contents]
+
+    def close(self):
+        """Stop the Node.js worker."""
+        with self._lock:
+            if self._process is not None:
+                self._process.stdin.close()
+                self._process.wait()
+                self._process = None
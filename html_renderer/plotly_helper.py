@@ -1,132 +1,611 @@
+from __future__ import annotations
 
-import plotly.graph_objects as go
-from typing import List, Union
+import copy
+import functools
+import re
+import numpy as np
+from typing import TYPE_CHECKING, Any, Dict, List, Union
 
-# Plotly Helper Functions
-class PlotlyHelper:
-    """Helper class for creating common Plotly visualizations."""
-    
-    @staticmethod
-    def create_bar_chart(x_data: List[str], y_data: List[float], 
-                        title: str = "", x_label: str = "", y_label: str = "",
-                        color: str = "#3498db") -> go.Figure:
-        """Create a compact bar chart optimized for embedding."""
-        fig = go.Figure(data=[
-            go.Bar(x=x_data, y=y_data, marker_color=color)
-        ])
-        fig.update_layout(
-            title=dict(text=title, font=dict(size=14)) if title else None,
-            xaxis=dict(title=x_label, tickfont=dict(size=10)),
-            yaxis=dict(title=y_label, tickfont=dict(size=10)),
-            template="plotly_white",
-            margin=dict(l=40, r=20, t=40, b=40),
-            height=200
-        )
-        return fig
-    
-    @staticmethod
-    def create_line_chart(x_data: List[Union[str, float]], y_data: List[float],
-                         title: str = "", x_label: str = "", y_label: str = "",
-                         color: str = "#e74c3c") -> go.Figure:
-        """Create a compact line chart optimized for embedding."""
-        fig = go.Figure(data=[
-            go.Scatter(x=x_data, y=y_data, mode='lines+markers', 
-                      line=dict(color=color, width=2),
-                      marker=dict(size=4, color=color))
-        ])
-        fig.update_layout(
-            title=dict(text=title, font=dict(size=14)) if title else None,
-            xaxis=dict(title=x_label, tickfont=dict(size=10)),
-            yaxis=dict(title=y_label, tickfont=dict(size=10)),
-            template="plotly_white",
-            margin=dict(l=40, r=20, t=40, b=40),
-            height=200
-        )
-        return fig
-    
-    @staticmethod
-    def create_pie_chart(labels: List[str], values: List[float],
-                        title: str = "") -> go.Figure:
-        """Create a compact pie chart optimized for embedding."""
-        fig = go.Figure(data=[
-            go.Pie(labels=labels, values=values, hole=0.3, textfont=dict(size=10))
-        ])
-        fig.update_layout(
-            title=dict(text=title, font=dict(size=14)) if title else None,
-            template="plotly_white",
-            margin=dict(l=20, r=20, t=40, b=20),
-            height=200,
+from .serialization import _JSON_ENGINE, _dumps
+
+# plotly is imported on first use inside the functions below: importing it
+# dominates start-up time, and table/text-only documents never need it.
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+# Maximum number of distinct figures kept per chart type
+_CACHE_SIZE = 256
+
+# Line charts longer than this are downsampled (LTTB) to _LTTB_POINTS points
+_LTTB_THRESHOLD = 2000
+_LTTB_POINTS = 500
+
+
+def _fig_to_json_fast(fig: go.Figure) -> str:
+    """Serialize a figure for embedding, skipping validation and using orjson when available."""
+    import plotly.io as pio
+    return pio.to_json(fig, validate=False, pretty=False, engine=_JSON_ENGINE)
+
+
+@functools.lru_cache(maxsize=None)
+def _template_json(name: str) -> Dict[str, Any]:
+    """Expanded layout template, for figures serialized without plotly.py."""
+    import plotly.io as pio
+    return pio.templates[name].to_plotly_json()
+
+
+class _ArrayKey:
+    """Hashable, read-only snapshot of a numpy array used as a cache key."""
+
+    __slots__ = ("array", "_buffer", "_hash")
+
+    def __init__(self, values: np.ndarray):
+        values = np.ascontiguousarray(values)
+        self._buffer = values.tobytes()
+        self.array = np.frombuffer(self._buffer, dtype=values.dtype).reshape(values.shape)
+        self._hash = hash((values.dtype.str, values.shape, self._buffer))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        return (isinstance(other, _ArrayKey)
+                and self.array.dtype == other.array.dtype
+                and self.array.shape == other.array.shape
+                and self._buffer == other._buffer)
+
+
+def _element_types(items: tuple) -> tuple:
+    """Nested element types of a frozen sequence."""
+    return tuple(_element_types(item) if isinstance(item, tuple) else type(item) for item in items)
+
+
+class _SequenceKey:
+    """Hashable snapshot of a sequence whose equality also compares element types,
+    since 1, 1.0 and True are equal and would otherwise share a cache entry."""
+
+    __slots__ = ("items", "_types", "_hash")
+
+    def __init__(self, items: tuple):
+        self.items = items
+        self._types = _element_types(items)
+        self._hash = hash(items)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        return (isinstance(other, _SequenceKey)
+                and self._types == other._types
+                and self.items == other.items)
+
+
+def _freeze_items(values: Any) -> Any:
+    """Convert (possibly nested) sequence inputs into hashable tuples."""
+    if isinstance(values, np.ndarray) and values.dtype != object:
+        return _ArrayKey(values)
+    if isinstance(values, (str, bytes)):
+        return values
+    try:
+        return tuple(_freeze_items(value) for value in values)
+    except TypeError:
+        return values
+
+
+def _freeze(values: Any) -> Any:
+    """Convert sequence inputs into hashable cache keys."""
+    frozen = _freeze_items(values)
+    return _SequenceKey(frozen) if isinstance(frozen, tuple) else frozen
+
+
+def _thaw(value: Any) -> Any:
+    """Undo _freeze so Plotly receives the array or tuple itself."""
+    if isinstance(value, _ArrayKey):
+        return value.array
+    if isinstance(value, _SequenceKey):
+        return value.items
+    return value
+
+
+def _memoize(builder):
+    """lru_cache a figure builder on its frozen arguments."""
+    @functools.lru_cache(maxsize=_CACHE_SIZE)
+    def cached(*args):
+        return builder(*(_thaw(arg) for arg in args))
+
+    def memoized(*args):
+        # Any argument may be a sequence, e.g. a per-bar color list
+        return cached(*(_freeze(arg) for arg in args))
+    return memoized
+
+
+def _as_float_array(values: Any) -> Any:
+    """Coerce numeric inputs to a contiguous float64 array; other inputs pass through."""
+    array = np.asarray(values)
+    if array.dtype.kind in "iufb":
+        return np.ascontiguousarray(array, dtype=np.float64)
+    return values
+
+
+def _histogram_bars(data: Any, bins: int):
+    """Pre-aggregate samples into (bin centers, counts, bin width) for a bar trace."""
+    data = np.asarray(data, dtype=np.float64)
+    # Plotly skips missing samples; np.histogram would reject a non-finite range
+    data = data[np.isfinite(data)]
+    counts, edges = np.histogram(data, bins=bins)
+    centers = (edges[:-1] + edges[1:]) * 0.5
+    return centers, counts, float(edges[1] - edges[0])
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Indices of the points kept by Largest-Triangle-Three-Buckets downsampling."""
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # n_out - 2 buckets between the (always kept) first and last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    indices = np.empty(n_out, dtype=np.intp)
+    indices[0] = 0
+    indices[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x = x[hi:edges[i + 2]].mean()
+            next_y = y[hi:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[n - 1], y[n - 1]
+        # Keep the point forming the largest triangle with the previous pick
+        # and the average of the next bucket
+        areas = np.abs((x[a] - next_x) * (y[lo:hi] - y[a]) -
+                       (x[a] - x[lo:hi]) * (next_y - y[a]))
+        a = lo + int(np.argmax(areas))
+        indices[i + 1] = a
+    return indices
+
+
+def _downsample_line(x_data: Any, y_data: Any, n_out: int = _LTTB_POINTS):
+    """Downsample line chart inputs with LTTB; non-numeric x values are treated as evenly spaced."""
+    x_values = np.asarray(x_data)
+    y_values = np.asarray(y_data, dtype=np.float64)
+    if x_values.dtype.kind in "iuf":
+        x_numeric = x_values.astype(np.float64)
+    else:
+        x_numeric = np.arange(len(y_values), dtype=np.float64)
+    indices = _lttb_indices(x_numeric, y_values, n_out)
+    return x_values[indices], y_values[indices]
+
+
+def _line_data(x_data: Any, y_data: Any, downsample: bool):
+    """Coerce line chart inputs and downsample long numeric series with LTTB."""
+    x_data = _as_float_array(x_data)
+    y_data = _as_float_array(y_data)
+    # Only numeric y with one x per point can be downsampled; anything else is passed through whole
+    if (downsample and len(y_data) > _LTTB_THRESHOLD and len(x_data) == len(y_data)
+            and getattr(y_data, "dtype", None) == np.float64):
+        x_data, y_data = _downsample_line(x_data, y_data)
+    return x_data, y_data
+
+
+# Layout shared by every chart type; chart-specific keys override it
+_COMMON_LAYOUT = {"margin": {"l": 40, "r": 20, "t": 40, "b": 40}, "height": 200}
+_TICK_FONT = {"size": 10}
+_TITLE_FONT = {"size": 14}
+
+
+def _layout(title: str, **layout: Any) -> Dict[str, Any]:
+    """Merge chart-specific layout keys over the shared layout, template and optional title."""
+    merged = {**_COMMON_LAYOUT, "template": _template_json("plotly_white"), **layout}
+    if title:
+        merged["title"] = {"text": title, "font": _TITLE_FONT}
+    return merged
+
+
+def _axis(label: str) -> Dict[str, Any]:
+    """Axis with a title and the shared tick font."""
+    return {"title": {"text": label}, "tickfont": _TICK_FONT}
+
+
+def _to_figure(fig_dict: Dict[str, Any]) -> go.Figure:
+    """Build a go.Figure from a cached figure dict."""
+    import plotly.graph_objects as go
+    return go.Figure(fig_dict)
+
+
+# Cached figure builders. They write the figure as plain dicts instead of
+# go.* objects, so no Plotly validators run until a go.Figure is requested,
+# and callers always get a fresh go.Figure that can never mutate a cached entry.
+@_memoize
+def _create_bar_chart_cached(x_data: Any, y_data: Any, title: str,
+                             x_label: str, y_label: str, color: str) -> Dict[str, Any]:
+    return {
+        "data": [{"type": "bar", "x": x_data, "y": y_data, "marker": {"color": color}}],
+        "layout": _layout(title, xaxis=_axis(x_label), yaxis=_axis(y_label))
+    }
+
+
+@_memoize
+def _create_line_chart_cached(x_data: Any, y_data: Any, title: str,
+                              x_label: str, y_label: str, color: str) -> Dict[str, Any]:
+    return {
+        "data": [{
+            "type": "scatter", "x": x_data, "y": y_data, "mode": "lines+markers",
+            "line": {"color": color, "width": 2},
+            "marker": {"size": 4, "color": color}
+        }],
+        "layout": _layout(title, xaxis=_axis(x_label), yaxis=_axis(y_label))
+    }
+
+
+@_memoize
+def _create_pie_chart_cached(labels: Any, values: Any, title: str) -> Dict[str, Any]:
+    return {
+        "data": [{
+            "type": "pie", "labels": labels, "values": values, "hole": 0.3,
+            "textfont": {"size": 10}
+        }],
+        "layout": _layout(
+            title,
+            margin={"l": 20, "r": 20, "t": 40, "b": 20},
             showlegend=True,
-            legend=dict(font=dict(size=9), orientation="h", y=-0.1)
+            legend={"font": {"size": 9}, "orientation": "h", "y": -0.1}
         )
-        return fig
-    
-    @staticmethod
-    def create_scatter_plot(x_data: List[float], y_data: List[float],
-                           title: str = "", x_label: str = "", y_label: str = "",
-                           color: str = "#9b59b6") -> go.Figure:
-        """Create a compact scatter plot optimized for embedding."""
-        fig = go.Figure(data=[
-            go.Scatter(x=x_data, y=y_data, mode='markers',
-                      marker=dict(size=6, color=color, opacity=0.7))
-        ])
-        fig.update_layout(
-            title=dict(text=title, font=dict(size=14)) if title else None,
-            xaxis=dict(title=x_label, tickfont=dict(size=10)),
-            yaxis=dict(title=y_label, tickfont=dict(size=10)),
-            template="plotly_white",
-            margin=dict(l=40, r=20, t=40, b=40),
-            height=200
-        )
-        return fig
-    
-    @staticmethod
-    def create_histogram(data: List[float], title: str = "", 
-                        x_label: str = "", bins: int = 15) -> go.Figure:
-        """Create a compact histogram optimized for embedding."""
-        fig = go.Figure(data=[
-            go.Histogram(x=data, nbinsx=bins, marker_color="#f39c12")
-        ])
-        fig.update_layout(
-            title=dict(text=title, font=dict(size=14)) if title else None,
-            xaxis=dict(title=x_label, tickfont=dict(size=10)),
-            yaxis=dict(title="Frequency", tickfont=dict(size=10)),
-            template="plotly_white",
-            margin=dict(l=40, r=20, t=40, b=40),
-            height=200
-        )
-        return fig
-    
-    @staticmethod
-    def create_box_plot(data: List[float], title: str = "",
-                       y_label: str = "") -> go.Figure:
-        """Create a compact box plot optimized for embedding."""
-        fig = go.Figure(data=[
-            go.Box(y=data, marker_color="#1abc9c", name="")
-        ])
-        fig.update_layout(
-            title=dict(text=title, font=dict(size=14)) if title else None,
-            yaxis=dict(title=y_label, tickfont=dict(size=10)),
-            template="plotly_white",
-            margin=dict(l=40, r=20, t=40, b=40),
-            height=200,
-            showlegend=False
-        )
-        return fig
-    
-    @staticmethod
-    def create_heatmap(z_data: List[List[float]], x_labels: List[str], 
-                      y_labels: List[str], title: str = "") -> go.Figure:
-        """Create a compact heatmap optimized for embedding."""
-        fig = go.Figure(data=[
-            go.Heatmap(z=z_data, x=x_labels, y=y_labels, colorscale='Viridis')
-        ])
-        fig.update_layout(
-            title=dict(text=title, font=dict(size=14)) if title else None,
-            template="plotly_white",
-            margin=dict(l=60, r=20, t=40, b=40),
-            height=200,
-            xaxis=dict(tickfont=dict(size=9)),
-            yaxis=dict(tickfont=dict(size=9))
+    }
+
+
+@_memoize
+def _create_scatter_plot_cached(x_data: Any, y_data: Any, title: str,
+                                x_label: str, y_label: str, color: str) -> Dict[str, Any]:
+    return {
+        "data": [{
+            "type": "scatter", "x": x_data, "y": y_data, "mode": "markers",
+            "marker": {"size": 6, "color": color, "opacity": 0.7}
+        }],
+        "layout": _layout(title, xaxis=_axis(x_label), yaxis=_axis(y_label))
+    }
+
+
+@_memoize
+def _create_histogram_cached(data: Any, title: str, x_label: str,
+                             bins: int) -> Dict[str, Any]:
+    centers, counts, width = _histogram_bars(data, bins)
+    return {
+        "data": [{
+            "type": "bar", "x": centers, "y": counts, "width": width,
+            "marker": {"color": "#f39c12"}
+        }],
+        "layout": _layout(title, xaxis=_axis(x_label), yaxis=_axis("Frequency"))
+    }
+
+
+@_memoize
+def _create_box_plot_cached(data: Any, title: str, y_label: str) -> Dict[str, Any]:
+    return {
+        "data": [{"type": "box", "y": data, "marker": {"color": "#1abc9c"}, "name": ""}],
+        "layout": _layout(title, yaxis=_axis(y_label), showlegend=False)
+    }
+
+
+@_memoize
+def _create_heatmap_cached(z_data: Any, x_labels: Any, y_labels: Any,
+                           title: str) -> Dict[str, Any]:
+    return {
+        "data": [{
+            "type": "heatmap", "z": z_data, "x": x_labels, "y": y_labels,
+            "colorscale": "Viridis"
+        }],
+        "layout": _layout(
+            title,
+            margin={"l": 60, "r": 20, "t": 40, "b": 40},
+            xaxis={"tickfont": {"size": 9}},
+            yaxis={"tickfont": {"size": 9}}
         )
-        return fig
+    }
+
+
+def _cached_json(builder):
+    """Wrap a cached figure builder so the compact JSON serialization is cached too."""
+    @functools.lru_cache(maxsize=_CACHE_SIZE)
+    def cached(*args):
+        import plotly.io as pio
+        return pio.to_json(builder(*args), validate=False, pretty=False, engine=_JSON_ENGINE)
+
+    def wrapper(*args):
+        return cached(*(_freeze(arg) for arg in args))
+    return wrapper
+
+
+_create_bar_chart_json_cached = _cached_json(_create_bar_chart_cached)
+_create_line_chart_json_cached = _cached_json(_create_line_chart_cached)
+_create_pie_chart_json_cached = _cached_json(_create_pie_chart_cached)
+_create_scatter_plot_json_cached = _cached_json(_create_scatter_plot_cached)
+_create_histogram_json_cached = _cached_json(_create_histogram_cached)
+_create_box_plot_json_cached = _cached_json(_create_box_plot_cached)
+_create_heatmap_json_cached = _cached_json(_create_heatmap_cached)
+
+
+# Placeholders left in the pre-serialized chart skeletons
+_PLACEHOLDER_RE = re.compile(r'"__(X_DATA|Y_DATA|LABELS|VALUES|TITLE|X_LABEL|Y_LABEL|COLOR)__"')
+
+
+@functools.lru_cache(maxsize=None)
+def _chart_template(kind: str, has_title: bool) -> str:
+    """
+    Serialize a chart type's figure once, with "__NAME__" placeholders where
+    the data, labels and color go. The layout comes from the regular cached
+    builder so the fast and regular charts stay identical; an empty title is
+    left out of the layout there, so it gets a skeleton of its own.
+    """
+    title = "__TITLE__" if has_title else ""
+    if kind == "pie":
+        figure = copy.deepcopy(_create_pie_chart_cached((), (), title))
+        figure["data"][0].update(labels="__LABELS__", values="__VALUES__")
+    else:
+        builder = {
+            "bar": _create_bar_chart_cached,
+            "line": _create_line_chart_cached,
+            "scatter": _create_scatter_plot_cached,
+        }[kind]
+        figure = copy.deepcopy(builder((), (), title, "__X_LABEL__", "__Y_LABEL__", "#000000"))
+        trace = figure["data"][0]
+        trace.update(x="__X_DATA__", y="__Y_DATA__")
+        trace["marker"]["color"] = "__COLOR__"
+        if "line" in trace:
+            trace["line"]["color"] = "__COLOR__"
+    import plotly.io as pio
+    return pio.to_json(figure, validate=False, pretty=False, engine=_JSON_ENGINE)
+
+
+def _fill_template(kind: str, **values: Any) -> str:
+    """Substitute serialized values into a chart skeleton in a single pass."""
+    fragments = {name.upper(): _dumps(value) for name, value in values.items()}
+    template = _chart_template(kind, bool(values.get("title")))
+    return _PLACEHOLDER_RE.sub(lambda match: fragments[match.group(1)], template)
+
+
+# Plotly Helper Functions
+# Figures are memoized on their arguments, so repeated calls with the same data
+# skip rebuilding the trace and layout objects. The *_json variants return the
+# cached JSON string instead, ready for HTMLRenderer.add_plotly_figure_json; the
+# *_fast variants build that JSON without going through go.Figure at all.
+def create_bar_chart(x_data: List[str], y_data: List[float],
+                     title: str = "", x_label: str = "", y_label: str = "",
+                     color: str = "#3498db") -> go.Figure:
+    """Create a compact bar chart optimized for embedding."""
+    return _to_figure(_create_bar_chart_cached(
+        x_data, y_data, title, x_label, y_label, color
+    ))
+
+
+def create_line_chart(x_data: Union[List[Union[str, float]], np.ndarray],
+                      y_data: Union[List[float], np.ndarray],
+                      title: str = "", x_label: str = "", y_label: str = "",
+                      color: str = "#e74c3c", downsample: bool = True) -> go.Figure:
+    """
+    Create a compact line chart optimized for embedding.
+
+    Inputs longer than 2000 points are downsampled to 500 points with
+    LTTB unless ``downsample`` is False.
+    """
+    x_data, y_data = _line_data(x_data, y_data, downsample)
+    return _to_figure(_create_line_chart_cached(
+        x_data, y_data, title, x_label, y_label, color
+    ))
+
+
+def create_pie_chart(labels: List[str], values: List[float],
+                     title: str = "") -> go.Figure:
+    """Create a compact pie chart optimized for embedding."""
+    return _to_figure(_create_pie_chart_cached(
+        labels, values, title
+    ))
+
+
+def create_scatter_plot(x_data: List[float], y_data: List[float],
+                        title: str = "", x_label: str = "", y_label: str = "",
+                        color: str = "#9b59b6") -> go.Figure:
+    """Create a compact scatter plot optimized for embedding."""
+    return _to_figure(_create_scatter_plot_cached(
+        x_data, y_data, title, x_label, y_label, color
+    ))
+
+
+def create_histogram(data: Union[List[float], np.ndarray], title: str = "",
+                     x_label: str = "", bins: int = 15) -> go.Figure:
+    """Create a compact histogram optimized for embedding, binned server-side."""
+    data = np.ascontiguousarray(data, dtype=np.float64)
+    return _to_figure(_create_histogram_cached(
+        data, title, x_label, bins
+    ))
+
+
+def create_histogram_fast(data: Union[List[float], np.ndarray], title: str = "",
+                          x_label: str = "", bins: int = 15) -> str:
+    """
+    Create a compact histogram directly as JSON, bypassing go.Figure.
+
+    The samples are binned with numpy and only the bin counts are
+    serialized (straight from the numpy buffers), so the payload grows
+    with ``bins`` rather than with the number of samples. Pass the result
+    to ``HTMLRenderer.add_plotly_figure_json``.
+    """
+    data = np.ascontiguousarray(data, dtype=np.float64)
+    centers, counts, width = _histogram_bars(data, bins)
+    figure = {
+        "data": [{
+            "type": "bar",
+            "x": centers,
+            "y": counts,
+            "width": width,
+            "marker": {"color": "#f39c12"}
+        }],
+        "layout": _layout(title, xaxis=_axis(x_label), yaxis=_axis("Frequency"))
+    }
+    return _dumps(figure)
+
+
+def create_box_plot(data: List[float], title: str = "",
+                    y_label: str = "") -> go.Figure:
+    """Create a compact box plot optimized for embedding."""
+    return _to_figure(_create_box_plot_cached(
+        data, title, y_label
+    ))
+
+
+def create_heatmap(z_data: List[List[float]], x_labels: List[str],
+                   y_labels: List[str], title: str = "") -> go.Figure:
+    """Create a compact heatmap optimized for embedding."""
+    return _to_figure(_create_heatmap_cached(
+        z_data, x_labels, y_labels, title
+    ))
+
+
+def create_bar_chart_json(x_data: List[str], y_data: List[float],
+                          title: str = "", x_label: str = "", y_label: str = "",
+                          color: str = "#3498db") -> str:
+    """Create a compact bar chart and return its cached JSON serialization."""
+    return _create_bar_chart_json_cached(
+        x_data, y_data, title, x_label, y_label, color
+    )
+
+
+def create_line_chart_json(x_data: Union[List[Union[str, float]], np.ndarray],
+                           y_data: Union[List[float], np.ndarray],
+                           title: str = "", x_label: str = "", y_label: str = "",
+                           color: str = "#e74c3c", downsample: bool = True) -> str:
+    """Create a compact line chart and return its cached JSON serialization."""
+    x_data, y_data = _line_data(x_data, y_data, downsample)
+    return _create_line_chart_json_cached(
+        x_data, y_data, title, x_label, y_label, color
+    )
+
+
+def create_pie_chart_json(labels: List[str], values: List[float],
+                          title: str = "") -> str:
+    """Create a compact pie chart and return its cached JSON serialization."""
+    return _create_pie_chart_json_cached(
+        labels, values, title
+    )
+
+
+def create_scatter_plot_json(x_data: List[float], y_data: List[float],
+                             title: str = "", x_label: str = "", y_label: str = "",
+                             color: str = "#9b59b6") -> str:
+    """Create a compact scatter plot and return its cached JSON serialization."""
+    return _create_scatter_plot_json_cached(
+        x_data, y_data, title, x_label, y_label, color
+    )
+
+
+def create_histogram_json(data: Union[List[float], np.ndarray], title: str = "",
+                          x_label: str = "", bins: int = 15) -> str:
+    """Create a compact histogram and return its cached JSON serialization."""
+    data = np.ascontiguousarray(data, dtype=np.float64)
+    return _create_histogram_json_cached(
+        data, title, x_label, bins
+    )
+
+
+def create_box_plot_json(data: List[float], title: str = "",
+                         y_label: str = "") -> str:
+    """Create a compact box plot and return its cached JSON serialization."""
+    return _create_box_plot_json_cached(
+        data, title, y_label
+    )
+
+
+def create_heatmap_json(z_data: List[List[float]], x_labels: List[str],
+                        y_labels: List[str], title: str = "") -> str:
+    """Create a compact heatmap and return its cached JSON serialization."""
+    return _create_heatmap_json_cached(
+        z_data, x_labels, y_labels, title
+    )
+
+
+def create_bar_chart_fast(x_data: List[str], y_data: Union[List[float], np.ndarray],
+                          title: str = "", x_label: str = "", y_label: str = "",
+                          color: str = "#3498db") -> str:
+    """
+    Create a compact bar chart as JSON by filling a pre-serialized skeleton.
+
+    Plotly's validators are skipped, so inputs must already be valid.
+    """
+    return _fill_template("bar", x_data=x_data, y_data=y_data, title=title,
+                          x_label=x_label, y_label=y_label, color=color)
+
+
+def create_line_chart_fast(x_data: Union[List[Union[str, float]], np.ndarray],
+                           y_data: Union[List[float], np.ndarray],
+                           title: str = "", x_label: str = "", y_label: str = "",
+                           color: str = "#e74c3c", downsample: bool = True) -> str:
+    """
+    Create a compact line chart as JSON by filling a pre-serialized skeleton.
+
+    Plotly's validators are skipped, so inputs must already be valid. Long
+    inputs are downsampled exactly as in ``create_line_chart``.
+    """
+    x_data, y_data = _line_data(x_data, y_data, downsample)
+    return _fill_template("line", x_data=x_data, y_data=y_data, title=title,
+                          x_label=x_label, y_label=y_label, color=color)
+
+
+def create_pie_chart_fast(labels: List[str], values: Union[List[float], np.ndarray],
+                          title: str = "") -> str:
+    """
+    Create a compact pie chart as JSON by filling a pre-serialized skeleton.
+
+    Plotly's validators are skipped, so inputs must already be valid.
+    """
+    return _fill_template("pie", labels=labels, values=values, title=title)
+
+
+def create_scatter_plot_fast(x_data: Union[List[float], np.ndarray],
+                             y_data: Union[List[float], np.ndarray],
+                             title: str = "", x_label: str = "", y_label: str = "",
+                             color: str = "#9b59b6") -> str:
+    """
+    Create a compact scatter plot as JSON by filling a pre-serialized skeleton.
+
+    Plotly's validators are skipped, so inputs must already be valid.
+    """
+    return _fill_template("scatter", x_data=x_data, y_data=y_data, title=title,
+                          x_label=x_label, y_label=y_label, color=color)
+
+
+def to_png_bytes(fig: Union[go.Figure, Dict[str, Any]], width: int = 600,
+                 height: int = 200) -> bytes:
+    """Render a figure (or raw figure dict) to a static PNG image (requires the ``kaleido`` package)."""
+    import plotly.io as pio
+    return pio.to_image(fig, format="png", width=width, height=height)
+
+
+class PlotlyHelper:
+    """
+    Helper class for creating common Plotly visualizations.
+
+    Each method is an alias of the module-level function of the same name,
+    kept for backward compatibility. Import the functions directly to skip
+    the class attribute lookup.
+    """
+
+    create_bar_chart = staticmethod(create_bar_chart)
+    create_line_chart = staticmethod(create_line_chart)
+    create_pie_chart = staticmethod(create_pie_chart)
+    create_scatter_plot = staticmethod(create_scatter_plot)
+    create_histogram = staticmethod(create_histogram)
+    create_histogram_fast = staticmethod(create_histogram_fast)
+    create_box_plot = staticmethod(create_box_plot)
+    create_heatmap = staticmethod(create_heatmap)
+    create_bar_chart_json = staticmethod(create_bar_chart_json)
+    create_line_chart_json = staticmethod(create_line_chart_json)
+    create_pie_chart_json = staticmethod(create_pie_chart_json)
+    create_scatter_plot_json = staticmethod(create_scatter_plot_json)
+    create_histogram_json = staticmethod(create_histogram_json)
+    create_box_plot_json = staticmethod(create_box_plot_json)
+    create_heatmap_json = staticmethod(create_heatmap_json)
+    create_bar_chart_fast = staticmethod(create_bar_chart_fast)
+    create_line_chart_fast = staticmethod(create_line_chart_fast)
+    create_pie_chart_fast = staticmethod(create_pie_chart_fast)
+    create_scatter_plot_fast = staticmethod(create_scatter_plot_fast)
+    to_png_bytes = staticmethod(to_png_bytes)
@@ -1,10 +1,296 @@
+from __future__ import annotations
+
+import functools
 import json
+import re
 import zlib
 import base64
-from typing import List, Dict, Any, Optional
-import plotly.graph_objects as go
-from plotly.offline import plot
+import warnings
+from typing import TYPE_CHECKING, List, Dict, Any, Iterable, Iterator, Optional, TextIO, Tuple, Union
 import html
+from urllib.parse import urlsplit
+
+from .latex import KatexPrerenderer
+from .serialization import _dumps
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+# Delimiters recognised by KaTeX auto-render ($, $$, \( and \[)
+_MATH_DELIMITER_RE = re.compile(r'\$|\\\(|\\\[')
+
+# Whitespace runs collapsed by render(compact=True)
+_WS_RE = re.compile(r'\s+')
+
+# Distinct document shells (flags, content type, custom CSS) kept per cache
+_SHELL_CACHE_SIZE = 64
+
+# zlib level for render_as_compressed_json; close to level 6's ratio on HTML at a fraction of the CPU
+_ZLIB_LEVEL = 3
+
+
+def _has_math(content: str) -> bool:
+    """Whether content contains LaTeX that KaTeX needs to typeset."""
+    return _MATH_DELIMITER_RE.search(content) is not None
+
+
+def _compact_fragments(fragments: Iterable[str]) -> Iterator[str]:
+    """
+    Collapse whitespace across a stream of HTML fragments, yielding the same text as
+    ``_WS_RE.sub(' ', "".join(fragments)).strip()`` without joining them first.
+    """
+    started = False
+    pending_space = False
+    for fragment in fragments:
+        fragment = _WS_RE.sub(' ', fragment)
+        core = fragment.strip(' ')
+        if not core:
+            pending_space = pending_space or bool(fragment)
+            continue
+        if started and (pending_space or fragment[0] == ' '):
+            yield ' '
+        yield core
+        started = True
+        pending_space = fragment[-1] == ' '
+
+
+def _json_script(element_id: str, payload: str) -> str:
+    """
+    Wrap serialized JSON in an inert ``<script type="application/json">`` block for
+    ``JSON.parse``. A ``<`` can only occur inside JSON strings, so escaping it as
+    ``\\u003c`` keeps ``</script>`` or ``<!--`` in the data from ending the block.
+    """
+    payload = payload.replace("<", "\\u003c")
+    return f'''
+    <script id="{element_id}" type="application/json">{payload}</script>'''
+
+
+def _figure_json(fig: Union[go.Figure, Dict[str, Any], str]) -> str:
+    """
+    Serialize a Plotly figure to compact JSON. Raw data/layout dicts are dumped
+    directly without building Plotly objects; pre-serialized JSON strings pass through.
+    """
+    if isinstance(fig, str):
+        return fig
+    if isinstance(fig, dict):
+        return _dumps(fig)
+    # plotly_helper pulls in numpy, which text/table-only documents never need
+    from .plotly_helper import _fig_to_json_fast
+    return _fig_to_json_fast(fig)
+
+
+# Pinned CDN library versions
+_KATEX_VERSION = "0.16.8"
+_PLOTLY_VERSION = "2.35.2"
+
+# Default asset host; library URLs follow its <base>/<library>/<version>/<file> layout
+_CDN_BASE = "https://cdnjs.cloudflare.com/ajax/libs"
+
+# Library tags; {base} is the asset host, {katex}/{plotly} the library versions
+_PRECONNECT_TAG = '''
+    <link rel="preconnect" href="{origin}">'''
+# The KaTeX stylesheet pulls its fonts from the same host. Font fetches are CORS
+# requests and cannot reuse the no-cors connection above, so they get their own
+_FONT_PRECONNECT_TAG = '''
+    <link rel="preconnect" href="{origin}" crossorigin>'''
+# KaTeX CSS is preloaded and swapped in on load so it does not block the first paint
+_KATEX_CSS_LINK = '''
+    <link rel="preload" as="style" href="{base}/KaTeX/{katex}/katex.min.css" onload="this.onload=null;this.rel='stylesheet'">
+    <noscript><link rel="stylesheet" href="{base}/KaTeX/{katex}/katex.min.css"></noscript>'''
+# Deferred scripts still run before DOMContentLoaded, where renderMathInElement is called
+_KATEX_JS_TAGS = '''
+    <script defer src="{base}/KaTeX/{katex}/katex.min.js"></script>
+    <script defer src="{base}/KaTeX/{katex}/contrib/auto-render.min.js"></script>'''
+_PLOTLY_JS_TAG = '''
+    <script src="{base}/plotly.js/{plotly}/plotly.min.js"></script>'''
+
+
+def _library_tags(asset_base: Optional[str], katex_version: str = _KATEX_VERSION,
+                  plotly_version: str = _PLOTLY_VERSION) -> Dict[str, str]:
+    """
+    Build the preconnect hint and library tags for an asset host (cdnjs when None).
+    Relative hosts are same-origin, so they get no preconnect hint.
+    """
+    base = (asset_base or _CDN_BASE).rstrip("/")
+    parts = urlsplit(base)
+    # Protocol-relative hosts ("//cdn.example.com") keep the page's scheme
+    origin = f"{parts.scheme}://{parts.netloc}" if parts.scheme else f"//{parts.netloc}"
+    return {
+        "preconnect": _PRECONNECT_TAG.format(origin=origin) if parts.netloc else "",
+        "font_preconnect": _FONT_PRECONNECT_TAG.format(origin=origin) if parts.netloc else "",
+        "katex_css": _KATEX_CSS_LINK.format(base=base, katex=katex_version),
+        "katex_js": _KATEX_JS_TAGS.format(base=base, katex=katex_version),
+        "plotly_js": _PLOTLY_JS_TAG.format(base=base, plotly=plotly_version),
+    }
+
+# Compact plotly config optimized for small embedded charts (Renderer)
+_DEFAULT_PLOTLY_CONFIG: Dict[str, Any] = {
+    'displayModeBar': False,  # Hide toolbar for compact display
+    'responsive': True,
+    'staticPlot': False,
+    'doubleClick': False,
+    'showTips': False,
+    'showAxisDragHandles': False,
+    'showAxisRangeEntryBoxes': False,
+    'modeBarButtonsToRemove': ['pan2d', 'select2d', 'lasso2d', 'resetScale2d', 'zoomIn2d', 'zoomOut2d']
+}
+_DEFAULT_PLOTLY_CONFIG_JSON = json.dumps(_DEFAULT_PLOTLY_CONFIG, separators=(',', ':'))
+
+# Plotly config for charts in a full HTMLRenderer document
+_DOCUMENT_PLOTLY_CONFIG: Dict[str, Any] = {
+    'displayModeBar': True,
+    'responsive': True,
+}
+_DOCUMENT_PLOTLY_CONFIG_JSON = json.dumps(_DOCUMENT_PLOTLY_CONFIG, separators=(',', ':'))
+
+# Accent styles for each Renderer content type
+_CONTENT_TYPE_STYLES: Dict[str, str] = {
+    "question": '''
+        .content-container {
+            border-left: 3px solid #007bff;
+            background: linear-gradient(135deg, #f8f9ff 0%, #ffffff 100%);
+        }
+        .content-text {
+            font-weight: 500;
+            color: #2c3e50;
+        }
+        .content-container::before {
+            content: "Q";
+            display: inline-block;
+            font-size: 10px;
+            color: #007bff;
+            font-weight: bold;
+            background: #007bff;
+            color: white;
+            padding: 2px 6px;
+            border-radius: 3px;
+            margin-bottom: 6px;
+            margin-right: 6px;
+        }''',
+    "option": '''
+        .content-container {
+            border-left: 3px solid #28a745;
+            background: linear-gradient(135deg, #f8fff8 0%, #ffffff 100%);
+        }
+        .content-text {
+            color: #2c3e50;
+        }
+        .content-container::before {
+            content: "A";
+            display: inline-block;
+            font-size: 10px;
+            color: white;
+            font-weight: bold;
+            background: #28a745;
+            padding: 2px 6px;
+            border-radius: 3px;
+            margin-bottom: 6px;
+            margin-right: 6px;
+        }''',
+    "general": '''
+        .content-container {
+            border-left: 3px solid #6c757d;
+        }''',
+}
+
+# Renderer <style> block up to the user's custom CSS, built once per content type
+_RENDERER_STYLE_HEAD = '''
+    <style>
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            margin: 0;
+            padding: 8px;
+            line-height: 1.4;
+            color: #333;
+            background-color: transparent;
+            font-size: 14px;
+        }
+        .content-container {
+            max-width: 100%;
+            margin: 0;
+            padding: 12px;
+            background-color: white;
+            border-radius: 6px;
+            box-shadow: 0 1px 4px rgba(0,0,0,0.1);
+            border: 1px solid #e0e0e0;
+        }
+        '''
+_RENDERER_STYLE_TAIL = '''
+        .plotly-container {
+            margin: 8px 0;
+            padding: 8px;
+            background-color: #fafafa;
+            border-radius: 4px;
+            border: 1px solid #e8e8e8;
+        }
+        .plotly-container img {
+            display: block;
+            max-width: 100%;
+            height: auto;
+        }
+        .katex-display {
+            margin: 0.8em 0;
+        }
+        .katex {
+            font-size: 1em;
+        }
+        .content-text {
+            font-size: 14px;
+            line-height: 1.5;
+            margin: 0;
+        }
+        .content-text h3 {
+            margin: 0 0 8px 0;
+            font-size: 14px;
+            font-weight: 600;
+        }
+        .content-text p {
+            margin: 6px 0;
+        }
+        .loading {
+            text-align: center;
+            padding: 8px;
+            color: #666;
+            font-size: 10px;
+        }
+        /* Ensure charts fit well in compact space */
+        #plotly-div {
+            /* Maintain a 16:9 aspect ratio while remaining responsive */
+            aspect-ratio: 16 / 9;
+            width: 100%;
+            min-height: 180px;
+            height: auto !important;
+        }
+        '''
+_RENDERER_STYLES: Dict[str, str] = {
+    content_type: _RENDERER_STYLE_HEAD + styles + _RENDERER_STYLE_TAIL
+    for content_type, styles in _CONTENT_TYPE_STYLES.items()
+}
+
+# Renderer bodies for documents without text content
+_CHART_ONLY_BODY = '''    <div class="content-container">
+        <div class="plotly-container">
+            <div id="plotly-div" class="loading">Loading chart...</div>
+        </div>
+    </div>'''
+_EMPTY_BODY = '''    <div class="content-container">
+    </div>'''
+
+# Document shell for Renderer; each slot is filled with a pre-built fragment
+_DOC_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+{css}
+</head>
+<body>
+{body}
+{scripts}
+</body>
+</html>"""
+
 
 class Renderer:
     """
@@ -16,12 +302,14 @@ class Renderer:
                  content: str,
                  need_latex: bool = False,
                  need_plotly: bool = False,
-                 plotly_figure: Optional[go.Figure] = None,
+                 plotly_figure: Optional[Union[go.Figure, Dict[str, Any], str]] = None,
                  plotly_config: Optional[Dict[str, Any]] = None,
                  custom_css: str = "",
                  custom_js: str = "",
                  title: str = "Content",
-                 content_type: str = "general"):
+                 content_type: str = "general",
+                 asset_base: Optional[str] = None,
+                 embed_head: bool = True):
         """
         Initialize renderer for a single piece of content.
         
@@ -29,12 +317,17 @@ class Renderer:
             content: The main content text
             need_latex: Whether to include KaTeX for LaTeX rendering
             need_plotly: Whether to include Plotly for interactive charts
-            plotly_figure: Plotly figure object to render
+            plotly_figure: Plotly figure object, raw data/layout dict, or pre-serialized JSON to render
             plotly_config: Plotly configuration options
             custom_css: Additional CSS styles
             custom_js: Additional JavaScript code
             title: HTML document title
             content_type: Type of content (question, option, general)
+            asset_base: Base URL serving the KaTeX and Plotly files in cdnjs layout
+                (e.g. ``/static/libs`` holding ``KaTeX/0.16.8/katex.min.js``);
+                defaults to cdnjs
+            embed_head: Whether to embed the library tags and base styles. When False
+                they are left to a head shared by several documents (see ``shared_head``)
         """
         self.content = content
         self.need_latex = need_latex
@@ -45,10 +338,13 @@ class Renderer:
         self.custom_js = custom_js
         self.title = title
         self.content_type = content_type
+        self.asset_base = asset_base
+        self.embed_head = embed_head
+        self._escaped_title = html.escape(title)
         
         # Library versions
-        self.katex_version = "0.16.8"
-        self.plotly_version = "2.26.0"
+        self.katex_version = _KATEX_VERSION
+        self.plotly_version = _PLOTLY_VERSION
         
     def render(self) -> str:
         """
@@ -57,168 +353,80 @@ class Renderer:
         Returns:
             Self-contained HTML string ready for iframe rendering
         """
-        html_parts = []
-        
-        # HTML document start
-        html_parts.append(self._get_html_header())
-        
-        # CSS and external libraries
-        html_parts.append(self._get_css_links())
-        
-        # Main content
-        html_parts.append(self._get_body_content())
-        
-        # JavaScript libraries and scripts
-        html_parts.append(self._get_js_scripts())
-        
-        # HTML document end
-        html_parts.append(self._get_html_footer())
-        
-        return "\n".join(html_parts)
-    
-    def _get_html_header(self) -> str:
-        """Generate HTML document header."""
-        escaped_title = html.escape(self.title)
-        return f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{escaped_title}</title>'''
+        return _DOC_TEMPLATE.format_map({
+            "title": self._escaped_title,
+            "css": self._get_css_links(),
+            "body": self._get_body_content(),
+            "scripts": self._get_js_scripts(),
+        })
     
     def _get_css_links(self) -> str:
         """Generate CSS links and styles."""
+        return self._shell_css(self.need_latex, self.need_plotly, self.content_type, self.custom_css,
+                               self.asset_base, self.embed_head, self.katex_version, self.plotly_version)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=_SHELL_CACHE_SIZE)
+    def _shell_css(need_latex: bool, need_plotly: bool, content_type: str, custom_css: str,
+                   asset_base: Optional[str], embed_head: bool, katex_version: str = _KATEX_VERSION,
+                   plotly_version: str = _PLOTLY_VERSION) -> str:
+        """Build the CSS links and styles once per combination of inputs."""
         css_parts = []
         
-        # KaTeX CSS
-        if self.need_latex:
-            css_parts.append(f'''
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/KaTeX/{self.katex_version}/katex.min.css">''')
-        
-        # Compact styles optimized for embedding
-        css_parts.append(f'''
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 8px;
-            line-height: 1.4;
-            color: #333;
-            background-color: transparent;
-            font-size: 14px;
-        }}
-        .content-container {{
-            max-width: 100%;
-            margin: 0;
-            padding: 12px;
-            background-color: white;
-            border-radius: 6px;
-            box-shadow: 0 1px 4px rgba(0,0,0,0.1);
-            border: 1px solid #e0e0e0;
-        }}
-        {self._get_content_type_styles()}
-        .plotly-container {{
-            margin: 8px 0;
-            padding: 8px;
-            background-color: #fafafa;
-            border-radius: 4px;
-            border: 1px solid #e8e8e8;
-        }}
-        .katex-display {{
-            margin: 0.8em 0;
-        }}
-        .katex {{
-            font-size: 1em;
-        }}
-        .content-text {{
-            font-size: 14px;
-            line-height: 1.5;
-            margin: 0;
-        }}
-        .content-text h3 {{
-            margin: 0 0 8px 0;
-            font-size: 14px;
-            font-weight: 600;
-        }}
-        .content-text p {{
-            margin: 6px 0;
-        }}
-        .loading {{
-            text-align: center;
-            padding: 8px;
-            color: #666;
-            font-size: 10px;
-        }}
-        /* Ensure charts fit well in compact space */
-        #plotly-div {{
-            /* Maintain a 16:9 aspect ratio while remaining responsive */
-            aspect-ratio: 16 / 9;
-            width: 100%;
-            min-height: 180px;
-            height: auto !important;
-        }}
-        {self.custom_css}
+        if embed_head:
+            tags = _library_tags(asset_base, katex_version, plotly_version)
+            
+            # Open the asset host connection early for the library downloads
+            if (need_latex or need_plotly) and tags["preconnect"]:
+                css_parts.append(tags["preconnect"])
+            if need_latex and tags["font_preconnect"]:
+                css_parts.append(tags["font_preconnect"])
+            
+            # KaTeX CSS
+            if need_latex:
+                css_parts.append(tags["katex_css"])
+            
+            # Compact styles optimized for embedding
+            style = _RENDERER_STYLES.get(content_type, _RENDERER_STYLES["general"])
+        else:
+            # Base styles come from the shared head; only the accent is per document
+            style = "\n    <style>" + _CONTENT_TYPE_STYLES.get(content_type, _CONTENT_TYPE_STYLES["general"])
+        css_parts.append(f'''{style}{custom_css}
     </style>''')
         
-        css_parts.append('</head>')
         return "\n".join(css_parts)
     
-    def _get_content_type_styles(self) -> str:
-        """Get CSS styles based on content type."""
-        if self.content_type == "question":
-            return '''
-        .content-container {
-            border-left: 3px solid #007bff;
-            background: linear-gradient(135deg, #f8f9ff 0%, #ffffff 100%);
-        }
-        .content-text {
-            font-weight: 500;
-            color: #2c3e50;
-        }
-        .content-container::before {
-            content: "Q";
-            display: inline-block;
-            font-size: 10px;
-            color: #007bff;
-            font-weight: bold;
-            background: #007bff;
-            color: white;
-            padding: 2px 6px;
-            border-radius: 3px;
-            margin-bottom: 6px;
-            margin-right: 6px;
-        }'''
-        elif self.content_type == "option":
-            return '''
-        .content-container {
-            border-left: 3px solid #28a745;
-            background: linear-gradient(135deg, #f8fff8 0%, #ffffff 100%);
-        }
-        .content-text {
-            color: #2c3e50;
-        }
-        .content-container::before {
-            content: "A";
-            display: inline-block;
-            font-size: 10px;
-            color: white;
-            font-weight: bold;
-            background: #28a745;
-            padding: 2px 6px;
-            border-radius: 3px;
-            margin-bottom: 6px;
-            margin-right: 6px;
-        }'''
-        else:
-            return '''
-        .content-container {
-            border-left: 3px solid #6c757d;
-        }'''
+    @staticmethod
+    @functools.lru_cache(maxsize=_SHELL_CACHE_SIZE)
+    def shared_head(need_latex: bool, need_plotly: bool, asset_base: Optional[str] = None,
+                    katex_version: str = _KATEX_VERSION, plotly_version: str = _PLOTLY_VERSION) -> str:
+        """
+        Library tags and base styles omitted from documents rendered with ``embed_head=False``.
+        Insert it right after each such document's ``<head>`` tag so its styles precede the
+        document's own.
+        """
+        head_parts = []
+        tags = _library_tags(asset_base, katex_version, plotly_version)
+        if (need_latex or need_plotly) and tags["preconnect"]:
+            head_parts.append(tags["preconnect"])
+        if need_latex and tags["font_preconnect"]:
+            head_parts.append(tags["font_preconnect"])
+        if need_latex:
+            head_parts.append(tags["katex_css"])
+        head_parts.append(_RENDERER_STYLE_HEAD + _RENDERER_STYLE_TAIL + "\n    </style>")
+        if need_latex:
+            head_parts.append(tags["katex_js"])
+        if need_plotly:
+            head_parts.append(tags["plotly_js"])
+        return "\n".join(head_parts)
     
     def _get_body_content(self) -> str:
         """Generate body content with plotly chart if needed."""
+        # Chart-only and empty documents skip the content-text wrapper entirely
+        if not self.content.strip():
+            return _CHART_ONLY_BODY if self.need_plotly and self.plotly_figure else _EMPTY_BODY
+        
         body_parts = []
-        body_parts.append('<body>')
         body_parts.append('    <div class="content-container">')
         body_parts.append('        <div class="content-text">')
         body_parts.append(f'            {self.content}')
@@ -235,18 +443,48 @@ class Renderer:
     
     def _get_js_scripts(self) -> str:
         """Generate JavaScript scripts."""
-        js_parts = []
+        js_parts = [self._shell_scripts_head(self.need_latex, self.need_plotly, self.asset_base, self.embed_head,
+                                             self.katex_version, self.plotly_version)]
         
-        # KaTeX JavaScript
-        if self.need_latex:
-            js_parts.append(f'''
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/KaTeX/{self.katex_version}/katex.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/KaTeX/{self.katex_version}/contrib/auto-render.min.js"></script>''')
+        # Plotly rendering; the figure data follows in its own JSON block
+        data_script = ""
+        if self.need_plotly and self.plotly_figure:
+            plotly_js, data_script = self._generate_plotly_js()
+            js_parts.append(plotly_js)
         
-        # Plotly JavaScript
-        if self.need_plotly:
+        # Custom JavaScript
+        if self.custom_js:
             js_parts.append(f'''
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/plotly.js/{self.plotly_version}/plotly.min.js"></script>''')
+            {self.custom_js}''')
+        
+        js_parts.append('''
+        });
+    </script>''')
+        
+        # Parsed on DOMContentLoaded, by which time the block below has been read
+        if data_script:
+            js_parts.append(data_script)
+        
+        return "\n".join(js_parts)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=_SHELL_CACHE_SIZE)
+    def _shell_scripts_head(need_latex: bool, need_plotly: bool, asset_base: Optional[str],
+                            embed_head: bool, katex_version: str = _KATEX_VERSION,
+                            plotly_version: str = _PLOTLY_VERSION) -> str:
+        """Build the library tags and script preamble once per combination of flags."""
+        js_parts = []
+        
+        if embed_head:
+            tags = _library_tags(asset_base, katex_version, plotly_version)
+            
+            # KaTeX JavaScript
+            if need_latex:
+                js_parts.append(tags["katex_js"])
+            
+            # Plotly JavaScript
+            if need_plotly:
+                js_parts.append(tags["plotly_js"])
         
         # Main JavaScript
         js_parts.append('''
@@ -254,7 +492,7 @@ class Renderer:
         document.addEventListener("DOMContentLoaded", function() {''')
         
         # KaTeX rendering
-        if self.need_latex:
+        if need_latex:
             js_parts.append('''
             renderMathInElement(document.body, {
                 delimiters: [
@@ -267,50 +505,33 @@ class Renderer:
                 errorColor: "#cc0000"
             });''')
         
-        # Plotly rendering
-        if self.need_plotly and self.plotly_figure:
-            js_parts.append(self._generate_plotly_js())
-        
-        # Custom JavaScript
-        if self.custom_js:
-            js_parts.append(f'''
-            {self.custom_js}''')
-        
-        js_parts.append('''
-        });
-    </script>''')
-        
         return "\n".join(js_parts)
     
-    def _generate_plotly_js(self) -> str:
-        """Generate Plotly JavaScript for rendering the figure."""
+    def _generate_plotly_js(self) -> Tuple[str, str]:
+        """
+        Generate Plotly JavaScript for rendering the figure.
+        
+        Returns:
+            The rendering script and the ``application/json`` block holding the figure
+            (empty if the figure could not be serialized)
+        """
         if not self.plotly_figure:
-            return ""
+            return "", ""
         
         try:
             # Convert plotly figure to JSON with proper escaping
-            fig_dict = self.plotly_figure.to_dict()
-            fig_json = json.dumps(fig_dict, separators=(',', ':'))
-            
-            # Compact plotly config optimized for small embedded charts
-            default_config = {
-                'displayModeBar': False,  # Hide toolbar for compact display
-                'responsive': True,
-                'staticPlot': False,
-                'doubleClick': False,
-                'showTips': False,
-                'showAxisDragHandles': False,
-                'showAxisRangeEntryBoxes': False,
-                'modeBarButtonsToRemove': ['pan2d', 'select2d', 'lasso2d', 'resetScale2d', 'zoomIn2d', 'zoomOut2d']
-            }
+            fig_json = _figure_json(self.plotly_figure)
             
-            # Merge with custom config
-            config = {**default_config, **self.plotly_config}
-            config_json = json.dumps(config, separators=(',', ':'))
+            # Merge with custom config; the default alone is serialized once at import
+            if self.plotly_config:
+                config = {**_DEFAULT_PLOTLY_CONFIG, **self.plotly_config}
+                config_json = json.dumps(config, separators=(',', ':'))
+            else:
+                config_json = _DEFAULT_PLOTLY_CONFIG_JSON
             
             return f'''
             try {{
-                const plotlyData = {fig_json};
+                const plotlyData = JSON.parse(document.getElementById("plotly-data").textContent);
                 const plotlyConfig = {config_json};
                 
                 if (plotlyData.layout) {{
@@ -342,7 +563,7 @@ class Renderer:
                 if (plotlyDiv) {{
                     plotlyDiv.innerHTML = "<div style=\\"text-align:center;padding:20px;color:#666;font-size:12px;\\">Chart unavailable</div>";
                 }}
-            }}'''
+            }}''', _json_script("plotly-data", fig_json)
         except Exception as e:
             error_msg = str(e).replace('"', '\\"')
             return f'''
@@ -350,12 +571,7 @@ class Renderer:
             const plotlyDiv = document.getElementById("plotly-div");
             if (plotlyDiv) {{
                 plotlyDiv.innerHTML = "<div style=\\"text-align:center;padding:20px;color:#666;font-size:12px;\\">Chart generation failed</div>";
-            }}'''
-    
-    def _get_html_footer(self) -> str:
-        """Generate HTML document footer."""
-        return '''</body>
-</html>'''
+            }}''', ""
 
 
 class HTMLRenderer:
@@ -364,7 +580,8 @@ class HTMLRenderer:
     This class orchestrates multiple Renderer instances to build a complete page.
     """
     
-    def __init__(self, title: str = "Rendered HTML", custom_css: str = "", custom_js: str = ""):
+    def __init__(self, title: str = "Rendered HTML", custom_css: str = "", custom_js: str = "",
+                 latex_prerenderer: Optional[KatexPrerenderer] = None, asset_base: Optional[str] = None):
         """
         Initialize the HTML renderer.
         
@@ -372,15 +589,29 @@ class HTMLRenderer:
             title: The title of the HTML document.
             custom_css: Custom CSS to be included in the document.
             custom_js: Custom JavaScript to be included in the document.
+            latex_prerenderer: Optional KatexPrerenderer used by render() to typeset
+                LaTeX on the server instead of loading KaTeX in the browser.
+            asset_base: Base URL serving the KaTeX and Plotly files in cdnjs layout,
+                used instead of cdnjs (e.g. a self-hosted, long-cached static path).
         """
         self.title = title
         self.custom_css = custom_css
         self.custom_js = custom_js
+        self.latex_prerenderer = latex_prerenderer
+        self.asset_base = asset_base
+        self._escaped_title = html.escape(title)
         self.content_blocks: List[Dict[str, Any]] = []
         
+        # Kept up to date by the add_* methods so rendering need not rescan the blocks;
+        # _scanned_blocks records what they describe, see _block_summary
+        self._need_latex = False
+        self._need_plotly = False
+        self._plotly_block_indices: List[int] = []
+        self._scanned_blocks: List[Dict[str, Any]] = []
+        
         # Library versions
-        self.katex_version = "0.16.8"
-        self.plotly_version = "2.26.0"
+        self.katex_version = _KATEX_VERSION
+        self.plotly_version = _PLOTLY_VERSION
         
     def add_content(self, content: str, content_type: str = "general"):
         """
@@ -390,49 +621,130 @@ class HTMLRenderer:
             content: The text content to add.
             content_type: The type of content (e.g., 'question', 'option').
         """
-        self.content_blocks.append({
+        self._append_block({
             "type": "text",
             "content": content,
             "content_type": content_type
         })
         return self
+    
+    def add_options(self, options: List[str]):
+        """
+        Add several option blocks at once.
+        
+        Equivalent to calling ``add_content(option, content_type="option")``
+        for each option.
         
-    def add_plotly_figure(self, fig: go.Figure, config: Optional[Dict[str, Any]] = None):
+        Args:
+            options: The option contents, in display order.
+        """
+        for option in options:
+            self._append_block({"type": "text", "content": option, "content_type": "option"})
+        return self
+        
+    def add_plotly_figure(self, fig: Union[go.Figure, Dict[str, Any]], config: Optional[Dict[str, Any]] = None,
+                          static: bool = False):
         """
         Add a Plotly figure to the document.
         
         Args:
-            fig: The Plotly figure object.
+            fig: The Plotly figure object, or a raw ``{"data": [...], "layout": {...}}``
+                dict which is serialized as-is without building Plotly objects.
             config: Optional Plotly configuration.
+            static: If True, embed the figure as an inline PNG (rendered with
+                kaleido) instead of an interactive chart, so the page does not
+                need to load Plotly.js.
         """
-        self.content_blocks.append({
+        if static:
+            from .plotly_helper import to_png_bytes
+            self._append_block({
+                "type": "image",
+                "png": base64.b64encode(to_png_bytes(fig)).decode('ascii')
+            })
+            return self
+        self._append_block({
             "type": "plotly",
             "figure": fig,
             "config": config or {"responsive": True}
         })
         return self
 
+    def add_plotly_figure_json(self, fig_json: str, config: Optional[Dict[str, Any]] = None):
+        """
+        Add a pre-serialized Plotly figure to the document.
+        
+        The JSON is embedded as-is, so figures cached with the
+        ``PlotlyHelper.create_*_json`` helpers are never re-serialized.
+        
+        Args:
+            fig_json: The figure serialized as a JSON string.
+            config: Optional Plotly configuration.
+        """
+        self._append_block({
+            "type": "plotly",
+            "figure": fig_json,
+            "config": config or {"responsive": True}
+        })
+        return self
+
     def add_table(self, data: List[List[Any]], headers: Optional[List[str]] = None):
         """Add a table block to the document."""
-        self.content_blocks.append({
+        self._append_block({
             "type": "table",
             "data": data,
             "headers": headers or []
         })
         return self
 
-    def render_as_blocks(self) -> List[str]:
-        """Render every content block as its own self-contained HTML string."""
+    def _append_block(self, block: Dict[str, Any]):
+        """Internal: Append a block and fold it into the cached LaTeX/Plotly summary."""
+        if block["type"] == "text":
+            self._need_latex = self._need_latex or _has_math(block["content"])
+        elif block["type"] == "plotly":
+            self._need_plotly = True
+            self._plotly_block_indices.append(len(self._scanned_blocks))
+        self._scanned_blocks.append(block)
+        self.content_blocks.append(block)
+
+    def _block_summary(self) -> Tuple[bool, bool, List[int]]:
+        """Internal: Return ``(need_latex, need_plotly, plotly_block_indices)``.
+
+        The cached values are reused while ``content_blocks`` still holds exactly
+        the blocks they were computed from; if the list was edited directly
+        (popped, cleared, appended to) they are recomputed from scratch.
+        """
+        blocks = self.content_blocks
+        scanned = self._scanned_blocks
+        if len(blocks) != len(scanned) or any(a is not b for a, b in zip(blocks, scanned)):
+            self._need_latex = any(block["type"] == "text" and _has_math(block["content"]) for block in blocks)
+            self._plotly_block_indices = [i for i, block in enumerate(blocks) if block["type"] == "plotly"]
+            self._need_plotly = bool(self._plotly_block_indices)
+            self._scanned_blocks = list(blocks)
+        return self._need_latex, self._need_plotly, self._plotly_block_indices
+
+    def render_as_blocks(self, shared_head: bool = False) -> Union[List[str], Tuple[str, List[str]]]:
+        """Render every content block as its own self-contained HTML string.
+        
+        Args:
+            shared_head: If True, the KaTeX/Plotly tags and base styles are left out of
+                every block and returned once as ``(head_html, blocks)``. Insert
+                ``head_html`` right after each block's ``<head>`` tag (or serve it once
+                from a cached parent template) instead of repeating it N times.
+        """
+        embed_head = not shared_head
         rendered: List[str] = []
         for idx, block in enumerate(self.content_blocks):
             try:
                 if block["type"] == "text":
                     r = Renderer(
                         content=block["content"],
-                        need_latex=True,
+                        need_latex=_has_math(block["content"]),
                         content_type=block.get("content_type", "general"),
-                        title=f"{self.title} – Text {idx+1}"
+                        title=f"{self.title} – Text {idx+1}",
+                        asset_base=self.asset_base,
+                        embed_head=embed_head
                     )
+                    r.katex_version = self.katex_version
                     rendered.append(r.render())
                 elif block["type"] == "plotly":
                     r = Renderer(
@@ -440,20 +752,36 @@ class HTMLRenderer:
                         need_plotly=True,
                         plotly_figure=block["figure"],
                         plotly_config=block["config"],
-                        title=f"{self.title} – Chart {idx+1}"
+                        title=f"{self.title} – Chart {idx+1}",
+                        asset_base=self.asset_base,
+                        embed_head=embed_head
+                    )
+                    r.plotly_version = self.plotly_version
+                    rendered.append(r.render())
+                elif block["type"] == "image":
+                    r = Renderer(
+                        content=self._render_image_block(block),
+                        title=f"{self.title} – Chart {idx+1}",
+                        embed_head=embed_head
                     )
                     rendered.append(r.render())
                 elif block["type"] == "table":
                     table_html = self.generate_table_html(block)
-                    r = Renderer(content=table_html, title=f"{self.title} – Table {idx+1}")
+                    r = Renderer(content=table_html, title=f"{self.title} – Table {idx+1}",
+                                 embed_head=embed_head)
                     rendered.append(r.render())
             except Exception as e:
                 # Create an error block if rendering fails
                 error_r = Renderer(
                     content=f'<div style="color: red; padding: 10px; border: 1px solid red; border-radius: 4px;">Error rendering block {idx+1}: {html.escape(str(e))}</div>',
-                    title=f"{self.title} – Error {idx+1}"
+                    title=f"{self.title} – Error {idx+1}",
+                    embed_head=embed_head
                 )
                 rendered.append(error_r.render())
+        if shared_head:
+            need_latex, need_plotly, _ = self._block_summary()
+            return Renderer.shared_head(need_latex, need_plotly, self.asset_base,
+                                        self.katex_version, self.plotly_version), rendered
         return rendered
 
     def render(self, compact: bool = False) -> str:
@@ -464,9 +792,8 @@ class HTMLRenderer:
         """
         html_content = self._render_full_html()
         if compact:
-            import re
             # Remove all extra whitespace and newlines
-            html_content = re.sub(r'\s+', ' ', html_content).strip()
+            html_content = _WS_RE.sub(' ', html_content).strip()
         return html_content
         
     def render_as_json(self, compact: bool = False) -> str:
@@ -476,32 +803,71 @@ class HTMLRenderer:
             compact: If True, removes extra whitespace from the HTML.
         """
         html_content = self.render(compact=compact)
-        # Use a custom JSON encoder to avoid escaping issues
-        return json.dumps({"html": html_content}, ensure_ascii=False, separators=(',', ':'))
+        # orjson (when installed) escapes the large HTML string far faster than the stdlib
+        return _dumps({"html": html_content})
         
     def render_as_compressed_json(self) -> str:
-        """Render as minified HTML and compress with zlib + base64."""
-        html_content = self.render(compact=True)
-        compressed = zlib.compress(html_content.encode('utf-8'))
-        return json.dumps({
-            "html_compressed": base64.b64encode(compressed).decode('ascii')
-        }, ensure_ascii=False, separators=(',', ':'))
+        """Render as minified HTML and compress with zlib + base64.
+        
+        The document is compressed fragment by fragment as it is generated,
+        so the full HTML string is never held in memory.
+        """
+        compressor = zlib.compressobj(_ZLIB_LEVEL)
+        chunks = [compressor.compress(fragment.encode('utf-8'))
+                  for fragment in _compact_fragments(self._iter_full_html())]
+        chunks.append(compressor.flush())
+        return _dumps({
+            "html_compressed": base64.b64encode(b"".join(chunks)).decode('ascii')
+        })
+    
+    def render_to(self, writer: TextIO, compact: bool = False) -> None:
+        """Write the full HTML document to a text stream piece by piece.
+        
+        Produces the same output as ``render`` without building the whole
+        document in memory first.
+        
+        Args:
+            writer: Any object with a ``write(str)`` method, e.g. an open file.
+            compact: If True, removes extra whitespace for a smaller output.
+        """
+        fragments = self._iter_full_html()
+        if compact:
+            fragments = _compact_fragments(fragments)
+        for fragment in fragments:
+            writer.write(fragment)
         
     def _render_full_html(self) -> str:
         """Internal: Generate the full HTML document."""
+        return "".join(self._iter_full_html())
+    
+    def _iter_full_html(self) -> Iterator[str]:
+        """Internal: Generate the full HTML document as a sequence of fragments."""
         # Determine if LaTeX or Plotly are needed
-        need_latex = any(block.get("type") == "text" for block in self.content_blocks)
-        need_plotly = any(block.get("type") == "plotly" for block in self.content_blocks)
+        need_latex, need_plotly, _ = self._block_summary()
+        
+        # Typeset all LaTeX on the server in one batch when a pre-renderer is set;
+        # the page then only needs the KaTeX stylesheet, not its scripts
+        prerendered: Dict[int, str] = {}
+        need_latex_js = need_latex
+        if need_latex and self.latex_prerenderer is not None:
+            text_indices = [i for i, block in enumerate(self.content_blocks) if block["type"] == "text"]
+            try:
+                contents = self.latex_prerenderer.prerender(
+                    [self.content_blocks[i]["content"] for i in text_indices]
+                )
+                prerendered = dict(zip(text_indices, contents))
+                need_latex_js = False
+            except (OSError, RuntimeError, ValueError) as e:
+                warnings.warn(f"LaTeX pre-rendering failed, falling back to client-side KaTeX: {e}")
         
         # Start HTML document
-        escaped_title = html.escape(self.title)
-        html_content = f'''<!DOCTYPE html>
+        yield f'''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{escaped_title}</title>
-    {self._get_css(need_latex)}
+    <title>{self._escaped_title}</title>
+    {self._get_css(need_latex, need_plotly)}
 </head>
 <body>
     <div class="main-container">
@@ -511,26 +877,28 @@ class HTMLRenderer:
         for i, block in enumerate(self.content_blocks):
             try:
                 if block["type"] == "text":
-                    html_content += self._render_text_block(block)
+                    if i in prerendered:
+                        block = {**block, "content": prerendered[i]}
+                    yield self._render_text_block(block)
                 elif block["type"] == "plotly":
-                    html_content += self._render_plotly_block(block, i)
+                    yield self._render_plotly_block(block, i)
+                elif block["type"] == "image":
+                    yield self._render_image_block(block)
                 elif block["type"] == "table":
-                    html_content += self.generate_table_html(block)
+                    yield self.generate_table_html(block)
             except Exception as e:
                 # Add error block if rendering fails
                 error_html = f'''<div style="color: red; padding: 10px; border: 1px solid red; border-radius: 4px; margin: 10px 0;">
                     Error rendering block {i+1}: {html.escape(str(e))}
                 </div>'''
-                html_content += error_html
+                yield error_html
         
         # End HTML document
-        html_content += f'''
+        yield f'''
     </div>
-    {self._get_js(need_latex, need_plotly)}
+    {self._get_js(need_latex_js, need_plotly)}
 </body>
 </html>'''
-        
-        return html_content
     
     def _render_text_block(self, block: Dict[str, Any]) -> str:
         """Render a single text block."""
@@ -539,11 +907,9 @@ class HTMLRenderer:
             content_type=block["content_type"],
             need_latex=True
         )
-        # Extract just the body content for embedding
-        body_content = renderer._get_body_content()
-        # Remove body tags
-        body_content = body_content.replace("<body>", "").replace("</body>", "").strip()
-        return body_content
+        # The body content carries no <body> tags (those live in _DOC_TEMPLATE),
+        # so it embeds as-is once the leading indentation is dropped
+        return renderer._get_body_content().lstrip()
 
     def generate_table_html(self, block: Dict[str, Any]) -> str:
         """Generate HTML for a single table block."""
@@ -580,12 +946,30 @@ class HTMLRenderer:
         </div>'''
         return container
     
-    def _get_css(self, need_latex: bool) -> str:
+    def _render_image_block(self, block: Dict[str, Any]) -> str:
+        """Render a static chart from its pre-rendered PNG."""
+        return f'''
+        <div class="plotly-container">
+            <img src="data:image/png;base64,{block["png"]}" alt="Chart">
+        </div>'''
+    
+    def _get_css(self, need_latex: bool, need_plotly: bool) -> str:
         """Generate CSS for the full document."""
+        return self._document_css(need_latex, need_plotly, self.custom_css, self.asset_base,
+                                  self.katex_version, self.plotly_version)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=_SHELL_CACHE_SIZE)
+    def _document_css(need_latex: bool, need_plotly: bool, custom_css: str, asset_base: Optional[str],
+                      katex_version: str = _KATEX_VERSION, plotly_version: str = _PLOTLY_VERSION) -> str:
+        """Build the full-document CSS once per combination of inputs."""
+        tags = _library_tags(asset_base, katex_version, plotly_version)
         css = ""
+        if need_latex or need_plotly:
+            css += tags["preconnect"]
         if need_latex:
-            css += f'''
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/KaTeX/{self.katex_version}/katex.min.css">'''
+            css += tags["font_preconnect"]
+            css += tags["katex_css"]
         
         css += f'''
     <style>
@@ -617,6 +1001,11 @@ class HTMLRenderer:
             border-radius: 4px;
             border: 1px solid #e8e8e8;
         }}
+        .plotly-container img {{
+            display: block;
+            max-width: 100%;
+            height: auto;
+        }}
         .table-container {{
             margin: 16px 0;
         }}
@@ -644,21 +1033,43 @@ class HTMLRenderer:
             min-height: 240px;
             height: auto !important;
         }}
-        {self.custom_css}
+        {custom_css}
     </style>'''
         return css
     
     def _get_js(self, need_latex: bool, need_plotly: bool) -> str:
         """Generate JS for the full document."""
+        js = self._document_scripts_head(need_latex, need_plotly, self.asset_base,
+                                         self.katex_version, self.plotly_version)
+        
+        if need_plotly:
+            js += self._get_all_plotly_js()
+            
+        if self.custom_js:
+            js += f'''
+            {self.custom_js}'''
+            
+        js += '''
+        });
+    </script>'''
+        
+        # Figure data, parsed on DOMContentLoaded once the whole page has been read
+        if need_plotly:
+            js += self._get_plotly_data_script()
+        return js
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=_SHELL_CACHE_SIZE)
+    def _document_scripts_head(need_latex: bool, need_plotly: bool, asset_base: Optional[str],
+                               katex_version: str = _KATEX_VERSION, plotly_version: str = _PLOTLY_VERSION) -> str:
+        """Build the full-document library tags and script preamble once per combination of flags."""
+        tags = _library_tags(asset_base, katex_version, plotly_version)
         js = ""
         if need_latex:
-            js += f'''
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/KaTeX/{self.katex_version}/katex.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/KaTeX/{self.katex_version}/contrib/auto-render.min.js"></script>'''
+            js += tags["katex_js"]
         
         if need_plotly:
-            js += f'''
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/plotly.js/{self.plotly_version}/plotly.min.js"></script>'''
+            js += tags["plotly_js"]
             
         js += '''
     <script>
@@ -677,77 +1088,73 @@ class HTMLRenderer:
                     throwOnError: false
                 });
             }'''
-            
-        if need_plotly:
-            js += self._get_all_plotly_js()
-            
-        if self.custom_js:
-            js += f'''
-            {self.custom_js}'''
-            
-        js += '''
-        });
-    </script>'''
         return js
     
-    def _get_all_plotly_js(self) -> str:
-        """Generate JS for all Plotly charts."""
-        js = ""
-        for i, block in enumerate(self.content_blocks):
-            if block["type"] == "plotly":
-                try:
-                    fig = block["figure"]
-                    config = block["config"]
-                    div_id = f"plotly-div-{i}"
-                    
-                    # Convert figure to dict and then to JSON with proper escaping
-                    fig_dict = fig.to_dict()
-                    fig_json = json.dumps(fig_dict, separators=(',', ':'))
-                    
-                    default_config = {
-                        'displayModeBar': True,
-                        'responsive': True,
-                    }
-                    final_config = {**default_config, **config}
+    def _get_plotly_data_script(self) -> str:
+        """Serialize every Plotly figure into one JSON block read by ``_get_all_plotly_js``."""
+        figs = []
+        for i in self._block_summary()[2]:
+            block = self.content_blocks[i]
+            div_id = f"plotly-div-{i}"
+            try:
+                # Convert figure to JSON with proper escaping
+                fig_json = _figure_json(block["figure"])
+                
+                # Configs that only repeat defaults reuse the pre-serialized JSON
+                if block["config"].items() <= _DOCUMENT_PLOTLY_CONFIG.items():
+                    config_json = _DOCUMENT_PLOTLY_CONFIG_JSON
+                else:
+                    final_config = {**_DOCUMENT_PLOTLY_CONFIG, **block["config"]}
                     config_json = json.dumps(final_config, separators=(',', ':'))
-                    
-                    js += f'''
-                try {{
-                    if (typeof Plotly !== "undefined") {{
-                        const plotlyData_{i} = {fig_json};
-                        const plotlyConfig_{i} = {config_json};
-                        Plotly.newPlot("{div_id}", plotlyData_{i}.data, plotlyData_{i}.layout, plotlyConfig_{i});
-                    }} else {{
-                        console.error("Plotly library not loaded");
-                        document.getElementById("{div_id}").innerHTML = "<div style=\\"text-align:center;padding:20px;color:#666;font-size:12px;\\">Plotly library not available</div>";
-                    }}
-                }} catch (e) {{
-                    console.error("Error rendering plotly chart {i}:", e);
-                    document.getElementById("{div_id}").innerHTML = "<div style=\\"text-align:center;padding:20px;color:#666;font-size:12px;\\">Error rendering chart</div>";
-                }}'''
-                except Exception as e:
-                    error_msg = str(e).replace('"', '\\"')
-                    js += f'''
-                console.error("Error preparing chart {i}:", "{error_msg}");
-                document.getElementById("plotly-div-{i}").innerHTML = "<div style=\\"text-align:center;padding:20px;color:#666;font-size:12px;\\">Chart preparation failed</div>";'''
-        
-        # Add resize handlers
-        js += '''
-        window.addEventListener("resize", function() {
-            if (typeof Plotly !== "undefined" && Plotly.Plots) {'''
-        
-        for i, block in enumerate(self.content_blocks):
-            if block["type"] == "plotly":
-                div_id = f"plotly-div-{i}"
-                js += f'''
-                try {{
-                    Plotly.Plots.resize("{div_id}");
-                }} catch (e) {{
-                    console.warn("Error resizing chart {i}:", e);
-                }}'''
+                
+                figs.append(f'{{"id":"{div_id}","figure":{fig_json},"config":{config_json}}}')
+            except Exception as e:
+                figs.append(f'{{"id":"{div_id}","error":{json.dumps(str(e))}}}')
         
-        js += '''
+        return _json_script("plotly-figs", f'[{",".join(figs)}]')
+    
+    def _get_all_plotly_js(self) -> str:
+        """Generate JS for all Plotly charts, plotted together in a single pass."""
+        return '''
+            try {
+                window.__FIGS__ = JSON.parse(document.getElementById("plotly-figs").textContent);
+            } catch (e) {
+                console.error("Error reading chart data:", e);
+                window.__FIGS__ = [];
+                document.querySelectorAll("[id^=\\"plotly-div-\\"]").forEach(function(div) {
+                    div.innerHTML = "<div style=\\"text-align:center;padding:20px;color:#666;font-size:12px;\\">Chart data unavailable</div>";
+                });
             }
-        });'''
-        
-        return js
+            window.__FIGS__.forEach(function(fig) {
+                const div = document.getElementById(fig.id);
+                if (fig.error) {
+                    console.error("Error preparing chart " + fig.id + ":", fig.error);
+                    div.innerHTML = "<div style=\\"text-align:center;padding:20px;color:#666;font-size:12px;\\">Chart preparation failed</div>";
+                    return;
+                }
+                try {
+                    if (typeof Plotly !== "undefined") {
+                        Plotly.newPlot(fig.id, fig.figure.data, fig.figure.layout, fig.config);
+                    } else {
+                        console.error("Plotly library not loaded");
+                        div.innerHTML = "<div style=\\"text-align:center;padding:20px;color:#666;font-size:12px;\\">Plotly library not available</div>";
+                    }
+                } catch (e) {
+                    console.error("Error rendering plotly chart " + fig.id + ":", e);
+                    div.innerHTML = "<div style=\\"text-align:center;padding:20px;color:#666;font-size:12px;\\">Error rendering chart</div>";
+                }
+            });
+            
+            window.addEventListener("resize", function() {
+                if (typeof Plotly !== "undefined" && Plotly.Plots) {
+                    window.__FIGS__.forEach(function(fig) {
+                        if (fig.error) return;
+                        try {
+                            Plotly.Plots.resize(fig.id);
+                        } catch (e) {
+                            console.warn("Error resizing chart " + fig.id + ":", e);
+                        }
+                    });
+                }
+            });'''
+
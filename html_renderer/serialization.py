@@ -0,0 +1,38 @@
+import json
+from typing import Any
+
+# numpy is deliberately not imported here: the renderer serializes every
+# document with _dumps, and text/table-only documents never need numpy.
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+# Engine for plotly.io.to_json: orjson walks numpy arrays in C
+_JSON_ENGINE = "orjson" if orjson is not None else "json"
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback encoder for numpy and datetime values that orjson (or json) cannot serialize."""
+    # numpy arrays and scalars, recognised without importing numpy
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: Any) -> str:
+    """
+    Serialize to compact UTF-8 JSON (non-ASCII left unescaped), walking numpy arrays
+    natively when orjson is available.
+    """
+    if orjson is not None:
+        # Arrays orjson cannot walk natively (non-contiguous, float16, ...) go through _json_default
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    encoded = json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=_json_default)
+    if "NaN" in encoded or "Infinity" in encoded:
+        # NaN/Infinity are not valid JSON; write them as null like orjson and PlotlyJSONEncoder
+        encoded = json.dumps(json.loads(encoded, parse_constant=lambda _: None),
+                             ensure_ascii=False, separators=(',', ':'))
+    return encoded
@@ -8,5 +8,10 @@ setup(
     install_requires=[
         'plotly',
         'jinja2',
+        'numpy',
     ],
+    extras_require={
+        'fast': ['orjson'],
+        'static': ['kaleido'],
+    },
 )
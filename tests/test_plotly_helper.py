@@ -0,0 +1,36 @@
+import json
+import unittest
+
+from html_renderer.plotly_helper import (
+    create_bar_chart, create_bar_chart_fast, create_bar_chart_json,
+    create_scatter_plot, create_scatter_plot_json,
+)
+
+
+class MemoizedChartArgumentsTest(unittest.TestCase):
+    """Memoized builders must accept every input Plotly accepts, not just hashable ones."""
+
+    def test_list_color_bar_chart(self):
+        colors = ["red", "blue"]
+        fig = create_bar_chart(["a", "b"], [1, 2], color=colors)
+        self.assertEqual(list(fig.data[0].marker.color), colors)
+
+        fig_json = create_bar_chart_json(["a", "b"], [1, 2], color=colors)
+        self.assertEqual(json.loads(fig_json)["data"][0]["marker"]["color"], colors)
+        self.assertEqual(json.loads(fig_json),
+                         json.loads(create_bar_chart_fast(["a", "b"], [1, 2], color=colors)))
+
+    def test_list_color_scatter_plot(self):
+        colors = ["red", "blue"]
+        fig = create_scatter_plot([1, 2], [3, 4], color=colors)
+        self.assertEqual(list(fig.data[0].marker.color), colors)
+        fig_json = create_scatter_plot_json([1, 2], [3, 4], color=colors)
+        self.assertEqual(json.loads(fig_json)["data"][0]["marker"]["color"], colors)
+
+    def test_equal_values_of_different_types_are_cached_apart(self):
+        self.assertEqual(json.loads(create_bar_chart_json(["a"], [1]))["data"][0]["y"], [1])
+        self.assertEqual(json.loads(create_bar_chart_json(["a"], [True]))["data"][0]["y"], [True])
+
+
+if __name__ == "__main__":
+    unittest.main()